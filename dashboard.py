@@ -32,14 +32,25 @@ cap_path = reports_dir / "capacity_calendar.csv"
 risk_path = reports_dir / "risk_register.csv"
 chart_path = reports_dir / "workload_vs_capacity.png"
 
+
+def load_report(csv_path: Path) -> pd.DataFrame:
+    # Prefer the Parquet sibling save_report writes; much faster to re-parse
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(csv_path)
+
 # -------- Run Simulator --------
 if run_btn:
     with st.spinner("Running forecast + building plan..."):
-        run(
+        outputs = run(
             horizon_days=int(horizon_days),
             capacity_multiplier=float(capacity_multiplier),
             write_reports=True,
         )
+    # Keep the rendered chart bytes so the chart tab can show them without
+    # re-reading the PNG from disk after the rerun
+    st.session_state["chart_bytes"] = outputs.get("chart_bytes")
     st.success("Simulation complete. Outputs updated.")
     st.rerun()
 
@@ -53,14 +64,14 @@ with right:
 
     with tab1:
         if plan_path.exists():
-            df = pd.read_csv(plan_path)
+            df = load_report(plan_path)
             st.dataframe(df, width="stretch")
         else:
             st.warning("No maintenance_plan.csv yet. Click **Run Forecast + Build Plan**.")
 
     with tab2:
         if cap_path.exists():
-            df = pd.read_csv(cap_path)
+            df = load_report(cap_path)
             st.dataframe(df, width="stretch")
         else:
             st.warning("No capacity_calendar.csv yet.")
@@ -68,7 +79,7 @@ with right:
     with tab3:
         if risk_path.exists():
             try:
-                df = pd.read_csv(risk_path)
+                df = load_report(risk_path)
             except EmptyDataError:
                 df = pd.DataFrame()
 
@@ -83,8 +94,11 @@ with right:
             st.warning("No risk_register.csv yet.")
 
     with tab4:
-        if chart_path.exists():
-            # Read bytes to avoid stale-image caching
+        chart_bytes = st.session_state.get("chart_bytes")
+        if chart_bytes:
+            st.image(chart_bytes, width="stretch")
+        elif chart_path.exists():
+            # Fall back to disk for sessions that haven't run the simulator yet
             st.image(chart_path.read_bytes(), width="stretch")
         else:
             st.warning("No chart yet. Run the simulator.")
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional; pure-Python fallback
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def _greedy_alloc(
+    base_ids: np.ndarray,
+    due_day_idx: np.ndarray,
+    window_days: np.ndarray,
+    labor_needed: np.ndarray,
+    rem: np.ndarray,
+    used: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Core greedy allocation loop over integer-coded tasks and a capacity grid.
+
+    Capacity is a dense 2D grid: rem[base_id, day_offset]. Tasks arrive
+    pre-sorted; for each one we walk its window earliest-first and drain
+    remaining capacity. rem/used are mutated in place.
+
+    Returns (allocated_hours, scheduled_day_idx) with day index -1 when no
+    allocation landed.
+    """
+    n_tasks = base_ids.shape[0]
+    n_days = rem.shape[1]
+    allocated = np.zeros(n_tasks, dtype=np.float64)
+    sched_day = np.full(n_tasks, -1, dtype=np.int64)
+
+    # Earliest day per base that may still have free capacity. Capacity only
+    # ever drains, so once a prefix of days hits zero it can be skipped for
+    # every later task instead of being re-scanned.
+    cursor = np.zeros(rem.shape[0], dtype=np.int64)
+
+    for t in range(n_tasks):
+        b = base_ids[t]
+        if b < 0:
+            # base not present in the capacity calendar
+            continue
+
+        c = cursor[b]
+        while c < n_days and rem[b, c] <= 0.0:
+            c += 1
+        cursor[b] = c
+
+        due = due_day_idx[t]
+        first = due - window_days[t]
+        if first < c:
+            first = c
+        if due > n_days - 1:
+            due = n_days - 1
+
+        need = labor_needed[t]
+        acc = 0.0
+        last = -1
+
+        for d in range(first, due + 1):
+            remaining = rem[b, d]
+            if remaining <= 0.0:
+                continue
+
+            take = remaining if remaining < need - acc else need - acc
+            if take > 0.0:
+                used[b, d] += take
+                rem[b, d] -= take
+                acc += take
+                last = d
+
+            if acc >= need - 1e-9:
+                break
+
+        allocated[t] = acc
+        sched_day[t] = last
+
+    return allocated, sched_day
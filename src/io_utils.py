@@ -3,27 +3,74 @@ from __future__ import annotations
 import os
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = PROJECT_ROOT / "data"
 REPORTS_DIR = PROJECT_ROOT / "reports"
 
+# Cache the CSV loaders when running under Streamlit so slider/button reruns
+# don't re-parse the files; plain no-op decorator for CLI use.
+try:
+    import streamlit as st
+
+    cache_data = st.cache_data(show_spinner=False)
+except ImportError:
+    def cache_data(func):
+        return func
+
 
 def ensure_reports_dir() -> None:
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Ordered so sort_values ranks High before Medium before Low directly
+CRITICALITY_DTYPE = pd.CategoricalDtype(["High", "Medium", "Low"], ordered=True)
+
+FLEET_DTYPES = {
+    "aircraft_id": "string",
+    "fleet_type": "category",
+    "base": "category",
+    "util_hours_per_day": "float64",
+}
+
+TASK_CARD_DTYPES = {
+    "task_id": "string",
+    "task_name": "string",
+    "fleet_type": "category",
+    "interval_days": "int32",
+    "interval_flight_hours": "int32",
+    "labor_hours": "float32",
+    "window_days": "int16",
+    "criticality": CRITICALITY_DTYPE,
+}
+
+
+@cache_data
+def _load_fleet(path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key so editing the file invalidates the entry
+    df = pd.read_csv(
+        path, engine="pyarrow", dtype=FLEET_DTYPES, parse_dates=["in_service_date"]
+    )
+    return df
+
+
+@cache_data
+def _load_task_cards(path: str, mtime: float) -> pd.DataFrame:
+    df = pd.read_csv(path, engine="pyarrow", dtype=TASK_CARD_DTYPES)
+    return df
+
+
 def load_fleet() -> pd.DataFrame:
     fleet_path = DATA_DIR / "fleet.csv"
-    df = pd.read_csv(fleet_path, parse_dates=["in_service_date"])
-    return df
+    return _load_fleet(str(fleet_path), fleet_path.stat().st_mtime)
 
 
 def load_task_cards() -> pd.DataFrame:
     task_path = DATA_DIR / "task_cards.csv"
-    df = pd.read_csv(task_path)
-    return df
+    return _load_task_cards(str(task_path), task_path.stat().st_mtime)
 
 
 def save_report(df: pd.DataFrame, filename: str) -> str:
@@ -48,4 +95,11 @@ def save_report(df: pd.DataFrame, filename: str) -> str:
             df = df.reindex(columns=RISK_COLUMNS)
 
     df.to_csv(out_path, index=False)
+
+    # Parquet sibling: the dashboard reloads reports on every rerun, and
+    # parsing Parquet is ~10x cheaper than re-parsing CSV.
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        out_path.with_suffix(".parquet"),
+    )
     return str(out_path)
\ No newline at end of file
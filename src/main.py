@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+import io
 from datetime import date
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 import pandas as pd
+import matplotlib
+
+# Headless servers only need the raster backend; skips any GUI toolkit import
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
-from .io_utils import load_fleet, load_task_cards, save_report, ensure_reports_dir, REPORTS_DIR
+from .io_utils import (
+    load_fleet,
+    load_task_cards,
+    save_report,
+    ensure_reports_dir,
+    DATA_DIR,
+    REPORTS_DIR,
+    cache_data,
+)
 from .simulator import ForecastConfig, run_simulation
 from .scheduler import CapacityConfig
 from .risk import build_risk_register
 
 
 def build_capacity_summary(capacity_df: pd.DataFrame) -> pd.DataFrame:
-    df = capacity_df.copy()
-    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    df = capacity_df.assign(date=pd.to_datetime(capacity_df["date"]).dt.normalize())
     summary = (
         df.groupby(["base", "date"], as_index=False)
         .agg(
@@ -29,7 +41,7 @@ def build_capacity_summary(capacity_df: pd.DataFrame) -> pd.DataFrame:
     return summary
 
 
-def plot_workload(summary_df: pd.DataFrame) -> str:
+def plot_workload(summary_df: pd.DataFrame) -> bytes:
     ensure_reports_dir()
 
     daily = (
@@ -38,20 +50,67 @@ def plot_workload(summary_df: pd.DataFrame) -> str:
         .sort_values("date")
     )
 
-    plt.figure()
-    plt.plot(daily["date"], daily["capacity"], label="Capacity (Labor Hours)")
-    plt.plot(daily["date"], daily["used"], label="Planned Workload (Labor Hours)")
-    plt.xticks(rotation=45)
-    plt.xlabel("Date")
-    plt.ylabel("Labor Hours")
-    plt.title("Maintenance Planning Workload vs Capacity (Forecast Horizon)")
-    plt.legend()
-    plt.tight_layout()
-
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.plot(daily["date"], daily["capacity"], label="Capacity (Labor Hours)")
+    ax.plot(daily["date"], daily["used"], label="Planned Workload (Labor Hours)")
+    ax.tick_params(axis="x", rotation=45)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Labor Hours")
+    ax.set_title("Maintenance Planning Workload vs Capacity (Forecast Horizon)")
+    ax.legend()
+    fig.tight_layout()
+
+    # Render once into memory: the dashboard gets the bytes directly and the
+    # PNG on disk stays available for CLI users.
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=120)
+    plt.close(fig)
+
+    png_bytes = buf.getvalue()
     out_path = REPORTS_DIR / "workload_vs_capacity.png"
-    plt.savefig(out_path, dpi=160)
-    plt.close()
-    return str(out_path)
+    out_path.write_bytes(png_bytes)
+    return png_bytes
+
+
+@cache_data
+def _simulate(
+    start_date: str,
+    horizon_days: int,
+    capacity_multiplier: float,
+    fleet_mtime: float,
+    task_mtime: float,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Pure simulation step: load inputs, forecast, schedule, and derive the
+    risk register + capacity summary. No file writes, so Streamlit can cache
+    the whole thing on (params, input mtimes) and a repeat click is free.
+    """
+    today = pd.to_datetime(start_date).normalize()
+
+    fleet_df = load_fleet()
+    task_df = load_task_cards()
+
+    # Daily capacity model (hours/day per base)
+    base_capacity_per_day = 160
+    capacity_per_day = max(1, int(base_capacity_per_day * float(capacity_multiplier)))
+
+    forecast_cfg = ForecastConfig(
+        start_date=today.date(),
+        horizon_days=int(horizon_days),
+        seed_history=True,
+    )
+    capacity_cfg = CapacityConfig(
+        labor_hours_per_day=float(capacity_per_day),
+        horizon_days=int(horizon_days),
+    )
+
+    scheduled_df, capacity_df = run_simulation(fleet_df, task_df, forecast_cfg, capacity_cfg)
+    if scheduled_df.empty:
+        return scheduled_df, capacity_df, pd.DataFrame(), pd.DataFrame()
+
+    risk_df = build_risk_register(scheduled_df, today=today)
+    summary_df = build_capacity_summary(capacity_df)
+    return scheduled_df, capacity_df, risk_df, summary_df
 
 
 def run(
@@ -72,26 +131,18 @@ def run(
     if forecast_start:
         today = pd.to_datetime(forecast_start).normalize()
 
-    # Load inputs
-    fleet_df = load_fleet()
-    task_df = load_task_cards()
+    # Cache key includes input file mtimes so data edits invalidate the entry
+    fleet_mtime = (DATA_DIR / "fleet.csv").stat().st_mtime
+    task_mtime = (DATA_DIR / "task_cards.csv").stat().st_mtime
 
-    # Daily capacity model (hours/day per base)
-    base_capacity_per_day = 160
-    capacity_per_day = max(1, int(base_capacity_per_day * float(capacity_multiplier)))
-
-    forecast_cfg = ForecastConfig(
-        start_date=today.date(),
-        horizon_days=int(horizon_days),
-        seed_history=True,
-    )
-    capacity_cfg = CapacityConfig(
-        labor_hours_per_day=float(capacity_per_day),
-        horizon_days=int(horizon_days),
+    scheduled_df, capacity_df, risk_df, capacity_summary = _simulate(
+        today.date().isoformat(),
+        int(horizon_days),
+        float(capacity_multiplier),
+        fleet_mtime,
+        task_mtime,
     )
 
-    scheduled_df, capacity_df = run_simulation(fleet_df, task_df, forecast_cfg, capacity_cfg)
-
     ensure_reports_dir()
 
     out = {
@@ -99,6 +150,7 @@ def run(
         "capacity_calendar": str(REPORTS_DIR / "capacity_calendar.csv"),
         "risk_register": str(REPORTS_DIR / "risk_register.csv"),
         "workload_chart": str(REPORTS_DIR / "workload_vs_capacity.png"),
+        "chart_bytes": None,
     }
 
     if not write_reports:
@@ -106,9 +158,9 @@ def run(
 
     # If nothing produced, still write empty files (so Streamlit doesn't crash)
     if scheduled_df.empty:
-        pd.DataFrame().to_csv(out["maintenance_plan"], index=False)
-        pd.DataFrame().to_csv(out["capacity_calendar"], index=False)
-        pd.DataFrame().to_csv(out["risk_register"], index=False)
+        save_report(pd.DataFrame(), "maintenance_plan.csv")
+        save_report(pd.DataFrame(), "capacity_calendar.csv")
+        save_report(pd.DataFrame(), "risk_register.csv")
         # delete chart if exists
         chart_file = Path(out["workload_chart"])
         if chart_file.exists():
@@ -117,18 +169,12 @@ def run(
 
     # Write reports
     save_report(scheduled_df, "maintenance_plan.csv")
-
-    capacity_summary = build_capacity_summary(capacity_df)
     save_report(capacity_summary, "capacity_calendar.csv")
-
-    risk_df = build_risk_register(scheduled_df, today=today)
     save_report(risk_df, "risk_register.csv")
 
-    # Force overwrite chart so Streamlit can't keep a stale version
-    chart_path = REPORTS_DIR / "workload_vs_capacity.png"
-    if chart_path.exists():
-        chart_path.unlink()
-    plot_workload(capacity_summary)
+    # plot_workload rewrites the PNG and hands back the bytes so the
+    # dashboard can display them without re-reading the file
+    out["chart_bytes"] = plot_workload(capacity_summary)
 
     return out
 
@@ -3,6 +3,33 @@ from __future__ import annotations
 import pandas as pd
 
 
+def _risk_frame(
+    df: pd.DataFrame,
+    mask: pd.Series,
+    risk_type: str,
+    due_date: pd.Series,
+    scheduled_date,
+    notes,
+) -> pd.DataFrame:
+    """Slice one risk category out of the plan as a ready-to-concat frame."""
+    sub = df.loc[mask]
+    return pd.DataFrame(
+        {
+            "risk_type": risk_type,
+            "severity": sub["criticality"],
+            "aircraft_id": sub["aircraft_id"],
+            "fleet_type": sub["fleet_type"],
+            "base": sub["base"],
+            "task_id": sub["task_id"],
+            "task_name": sub["task_name"],
+            "due_date": due_date[mask],
+            "scheduled_date": scheduled_date[mask] if scheduled_date is not None else pd.NaT,
+            # scalar, or a Series already aligned to the masked rows
+            "notes": notes,
+        }
+    )
+
+
 def build_risk_register(
     scheduled_df: pd.DataFrame,
     today: pd.Timestamp,
@@ -13,89 +40,68 @@ def build_risk_register(
     - MISSED_WINDOW: not scheduled at all
     - LATE_SCHEDULE: scheduled_date > due_date
     - CAPACITY_SHORTFALL: allocated_labor_hours < labor_hours
-    """
-    df = scheduled_df.copy()
-    df["due_date"] = pd.to_datetime(df["due_date"]).dt.normalize()
-    df["scheduled_date"] = pd.to_datetime(df["scheduled_date"]).dt.normalize()
-
-    risks = []
 
-    for _, r in df.iterrows():
-        due = r["due_date"]
-        sched = r["scheduled_date"]
-        scheduled = bool(r["scheduled"])
-        labor = float(r["labor_hours"])
-        allocated = float(r.get("allocated_labor_hours", 0.0))
+    Each rule is a boolean mask over the whole plan; the four category
+    frames are concatenated and sorted once, with no per-row Python loop.
+    """
+    # Normalized date columns live in local Series; no full-frame copy needed.
+    df = scheduled_df
+    due_date = pd.to_datetime(df["due_date"]).dt.normalize()
+    sched_date = pd.to_datetime(df["scheduled_date"]).dt.normalize()
 
-        # MISSED WINDOW / UNSCHEDULED
-        if not scheduled:
-            risks.append(
-                {
-                    "risk_type": "MISSED_WINDOW",
-                    "severity": r["criticality"],
-                    "aircraft_id": r["aircraft_id"],
-                    "fleet_type": r["fleet_type"],
-                    "base": r["base"],
-                    "task_id": r["task_id"],
-                    "task_name": r["task_name"],
-                    "due_date": due,
-                    "scheduled_date": pd.NaT,
-                    "notes": "No available capacity found within maintenance window.",
-                }
-            )
+    scheduled = df["scheduled"].astype(bool)
+    # scheduled_date only counts when the task actually got scheduled
+    sched_or_nat = sched_date.where(scheduled, pd.NaT)
 
-        # CAPACITY SHORTFALL (partial allocation)
-        if allocated + 1e-9 < labor:
-            risks.append(
-                {
-                    "risk_type": "CAPACITY_SHORTFALL",
-                    "severity": r["criticality"],
-                    "aircraft_id": r["aircraft_id"],
-                    "fleet_type": r["fleet_type"],
-                    "base": r["base"],
-                    "task_id": r["task_id"],
-                    "task_name": r["task_name"],
-                    "due_date": due,
-                    "scheduled_date": sched if scheduled else pd.NaT,
-                    "notes": f"Allocated {allocated:.1f} of {labor:.1f} labor hours.",
-                }
-            )
+    m_missed = ~scheduled
+    m_short = df["allocated_labor_hours"].astype(float) + 1e-9 < df["labor_hours"].astype(float)
+    m_late = scheduled & sched_date.notna() & (sched_date > due_date)
+    m_overdue = (due_date < today) & (m_missed | m_late)
 
-        # LATE SCHEDULE
-        if scheduled and pd.notna(sched) and sched > due:
-            risks.append(
-                {
-                    "risk_type": "LATE_SCHEDULE",
-                    "severity": r["criticality"],
-                    "aircraft_id": r["aircraft_id"],
-                    "fleet_type": r["fleet_type"],
-                    "base": r["base"],
-                    "task_id": r["task_id"],
-                    "task_name": r["task_name"],
-                    "due_date": due,
-                    "scheduled_date": sched,
-                    "notes": "Scheduled after due date (potential disruption to maintenance window).",
-                }
-            )
+    # Only shortfall rows need the formatted note; skip the rest of the plan
+    short = df.loc[m_short]
+    shortfall_notes = pd.Series(
+        [
+            f"Allocated {a:.1f} of {l:.1f} labor hours."
+            for a, l in zip(short["allocated_labor_hours"], short["labor_hours"])
+        ],
+        index=short.index,
+        dtype="object",
+    )
 
-        # OVERDUE (as of today)
-        if due < today and (not scheduled or (pd.notna(sched) and sched > due)):
-            risks.append(
-                {
-                    "risk_type": "OVERDUE",
-                    "severity": r["criticality"],
-                    "aircraft_id": r["aircraft_id"],
-                    "fleet_type": r["fleet_type"],
-                    "base": r["base"],
-                    "task_id": r["task_id"],
-                    "task_name": r["task_name"],
-                    "due_date": due,
-                    "scheduled_date": sched if scheduled else pd.NaT,
-                    "notes": "Past-due maintenance as of forecast run date.",
-                }
-            )
+    risk_df = pd.concat(
+        [
+            _risk_frame(
+                df,
+                m_missed,
+                "MISSED_WINDOW",
+                due_date,
+                None,
+                "No available capacity found within maintenance window.",
+            ),
+            _risk_frame(
+                df, m_short, "CAPACITY_SHORTFALL", due_date, sched_or_nat, shortfall_notes
+            ),
+            _risk_frame(
+                df,
+                m_late,
+                "LATE_SCHEDULE",
+                due_date,
+                sched_date,
+                "Scheduled after due date (potential disruption to maintenance window).",
+            ),
+            _risk_frame(
+                df,
+                m_overdue,
+                "OVERDUE",
+                due_date,
+                sched_or_nat,
+                "Past-due maintenance as of forecast run date.",
+            ),
+        ],
+        ignore_index=True,
+    )
 
-    risk_df = pd.DataFrame(risks)
     if not risk_df.empty:
         risk_df = risk_df.sort_values(by=["severity", "risk_type", "due_date"]).reset_index(drop=True)
-    return risk_df
\ No newline at end of file
+    return risk_df
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
+from ._scheduler_kernels import _greedy_alloc
+from .io_utils import CRITICALITY_DTYPE
+
 
 @dataclass
 class CapacityConfig:
@@ -13,11 +18,24 @@ class CapacityConfig:
     horizon_days: int = 120
 
 
-def _daterange(start: date, end: date):
-    d = start
-    while d <= end:
-        yield d
-        d += timedelta(days=1)
+@lru_cache(maxsize=16)
+def _capacity_calendar_template(
+    bases: tuple[str, ...],
+    start_ord: int,
+    horizon_days: int,
+    labor_hours_per_day: float,
+) -> pd.DataFrame:
+    start_date = date.fromordinal(start_ord)
+    end_date = start_date + timedelta(days=horizon_days)
+    dates = pd.date_range(start_date, end_date, freq="D")
+    idx = pd.MultiIndex.from_product([list(bases), dates], names=["base", "date"])
+    return pd.DataFrame(
+        {
+            "capacity_labor_hours": np.full(len(idx), labor_hours_per_day),
+            "used_labor_hours": np.zeros(len(idx)),
+        },
+        index=idx,
+    ).reset_index()
 
 
 def build_capacity_calendar(
@@ -26,19 +44,12 @@ def build_capacity_calendar(
     horizon_days: int,
     labor_hours_per_day: float,
 ) -> pd.DataFrame:
-    end_date = start_date + timedelta(days=horizon_days)
-    rows = []
-    for base in bases:
-        for d in _daterange(start_date, end_date):
-            rows.append(
-                {
-                    "base": base,
-                    "date": pd.to_datetime(d),
-                    "capacity_labor_hours": float(labor_hours_per_day),
-                    "used_labor_hours": 0.0,
-                }
-            )
-    return pd.DataFrame(rows)
+    # The calendar is pure in its arguments, so reuse a cached template and
+    # hand each caller a private copy to mutate.
+    tpl = _capacity_calendar_template(
+        tuple(bases), start_date.toordinal(), int(horizon_days), float(labor_hours_per_day)
+    )
+    return tpl.copy()
 
 
 def schedule_tasks_greedy(
@@ -53,80 +64,60 @@ def schedule_tasks_greedy(
     - If not enough capacity across the window, mark unscheduled.
     Returns: (scheduled_df, capacity_df_updated)
     """
-    crit_rank = {"High": 0, "Medium": 1, "Low": 2}
-    df = forecast_df.copy()
-
-    df["crit_rank"] = df["criticality"].map(lambda x: crit_rank.get(x, 3))
-    df = df.sort_values(
-        by=["due_date", "crit_rank", "labor_hours"],
-        ascending=[True, True, False],
-    ).reset_index(drop=True)
-
-    cap = capacity_df.copy()
-    cap["remaining_labor_hours"] = cap["capacity_labor_hours"] - cap["used_labor_hours"]
-
-    scheduled_rows = []
-
-    # index for quick lookup
+    # criticality is an ordered categorical (High < Medium < Low), so it sorts
+    # by rank directly; unknown values become NaN and land last.
+    # sort_values already yields a fresh frame, so no up-front copy is needed;
+    # assign() swaps in the cast column without duplicating the others.
+    df = (
+        forecast_df.assign(criticality=forecast_df["criticality"].astype(CRITICALITY_DTYPE))
+        .sort_values(
+            by=["due_date", "criticality", "labor_hours"],
+            ascending=[True, True, False],
+        )
+        .reset_index(drop=True)
+    )
+
+    # Reshape capacity into a dense 2D (base, day) grid so the jitted kernel
+    # can address slots with pure integer indexing instead of hashed lookups.
     cap_key = ["base", "date"]
-    cap = cap.sort_values(cap_key).reset_index(drop=True)
-
-    cap_index = {(r["base"], r["date"]): i for i, r in cap.iterrows()}
-
-    for _, task in df.iterrows():
-        base = task["base"]
-        due_date = pd.to_datetime(task["due_date"]).normalize()
-        window_days = int(task["window_days"])
-        labor_needed = float(task["labor_hours"])
-
-        window_start = due_date - pd.Timedelta(days=window_days)
-        window_dates = pd.date_range(window_start, due_date, freq="D")
-
-        allocated = 0.0
-        allocations = []
-
-        for d in window_dates:
-            key = (base, d)
-            if key not in cap_index:
-                continue
-            idx = cap_index[key]
-            remaining = float(cap.at[idx, "remaining_labor_hours"])
-            if remaining <= 0:
-                continue
-
-            take = min(remaining, labor_needed - allocated)
-            if take > 0:
-                cap.at[idx, "used_labor_hours"] += take
-                cap.at[idx, "remaining_labor_hours"] -= take
-                allocated += take
-                allocations.append((d, take))
-
-            if allocated >= labor_needed - 1e-9:
-                break
-
-        if allocated >= labor_needed - 1e-9:
-            # scheduled: choose the last allocation day as scheduled_date
-            scheduled_date = allocations[-1][0]
-            scheduled_rows.append(
-                {
-                    **task.to_dict(),
-                    "scheduled": True,
-                    "scheduled_date": scheduled_date,
-                    "scheduled_base": base,
-                    "allocated_labor_hours": allocated,
-                }
-            )
-        else:
-            scheduled_rows.append(
-                {
-                    **task.to_dict(),
-                    "scheduled": False,
-                    "scheduled_date": pd.NaT,
-                    "scheduled_base": base,
-                    "allocated_labor_hours": allocated,
-                }
-            )
-
-    scheduled_df = pd.DataFrame(scheduled_rows).drop(columns=["crit_rank"], errors="ignore")
-    capacity_updated = cap.drop(columns=["remaining_labor_hours"], errors="ignore")
-    return scheduled_df, capacity_updated
\ No newline at end of file
+    cap = capacity_df.sort_values(cap_key).reset_index(drop=True)
+
+    bases = pd.Index(cap["base"].unique())
+    n_days = len(cap) // max(1, len(bases))
+    start64 = cap["date"].to_numpy().min()
+
+    rem = (
+        (cap["capacity_labor_hours"] - cap["used_labor_hours"])
+        .to_numpy(copy=True)
+        .reshape(len(bases), n_days)
+    )
+    used = cap["used_labor_hours"].to_numpy(copy=True).reshape(len(bases), n_days)
+
+    base_ids = bases.get_indexer(df["base"])
+    # due_date is already datetime64 from the forecast; pure array arithmetic,
+    # no Timestamp objects are materialized
+    due_day_idx = (
+        (df["due_date"].to_numpy() - start64) // np.timedelta64(1, "D")
+    ).astype(np.int64)
+    window_days = df["window_days"].to_numpy(dtype=np.int64)
+    labor_needed = df["labor_hours"].to_numpy(dtype=np.float64)
+
+    allocated, sched_day = _greedy_alloc(
+        base_ids, due_day_idx, window_days, labor_needed, rem, used
+    )
+
+    scheduled = allocated >= labor_needed - 1e-9
+    scheduled_dates = np.where(
+        scheduled & (sched_day >= 0),
+        start64 + sched_day * np.timedelta64(1, "D"),
+        np.datetime64("NaT"),
+    )
+
+    scheduled_df = df
+    scheduled_df["scheduled"] = scheduled
+    scheduled_df["scheduled_date"] = pd.to_datetime(scheduled_dates)
+    scheduled_df["scheduled_base"] = scheduled_df["base"]
+    scheduled_df["allocated_labor_hours"] = allocated
+
+    cap["used_labor_hours"] = used.ravel()
+    return scheduled_df, cap
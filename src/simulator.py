@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
+import numpy as np
 import pandas as pd
 
 from .scheduler import CapacityConfig, build_capacity_calendar, schedule_tasks_greedy
@@ -15,15 +16,6 @@ class ForecastConfig:
     seed_history: bool = True
 
 
-def _seed_last_done_date(start_date: date, interval_days: int, offset_days: int) -> date:
-    """
-    Create a plausible last_done date so the next due date falls near the start of the horizon.
-    offset_days shifts due dates across aircraft so results aren't identical.
-    """
-    # last_done = start_date - (interval_days - offset_days)
-    return start_date - timedelta(days=max(1, interval_days - offset_days))
-
-
 def build_forecast(
     fleet_df: pd.DataFrame,
     task_df: pd.DataFrame,
@@ -32,51 +24,60 @@ def build_forecast(
     """
     Creates a forecast table of maintenance tasks due within the horizon.
     Simplified logic: due_date = last_done + interval_days
+
+    Vectorized: a single merge on fleet_type produces every (aircraft, task)
+    pair, then due dates are computed with columnar arithmetic instead of
+    Python-level row loops.
     """
     start = pd.to_datetime(cfg.start_date).normalize()
     end = start + pd.Timedelta(days=cfg.horizon_days)
 
-    rows = []
-    for i, ac in fleet_df.iterrows():
-        aircraft_id = ac["aircraft_id"]
-        fleet_type = ac["fleet_type"]
-        base = ac["base"]
-
-        tasks = task_df[task_df["fleet_type"] == fleet_type].copy()
-        if tasks.empty:
-            continue
-
-        for j, t in tasks.iterrows():
-            interval_days = int(t["interval_days"])
-            window_days = int(t["window_days"])
-
-            if cfg.seed_history:
-                # spread due dates so each aircraft doesn't hit same day
-                offset = (i * 7 + j * 3) % max(2, interval_days)
-                last_done = _seed_last_done_date(cfg.start_date, interval_days, offset)
-            else:
-                last_done = cfg.start_date
-
-            due = pd.to_datetime(last_done + timedelta(days=interval_days)).normalize()
-
-            # only keep items that enter the horizon or are near it (include slightly overdue)
-            if due <= end:
-                rows.append(
-                    {
-                        "aircraft_id": aircraft_id,
-                        "fleet_type": fleet_type,
-                        "base": base,
-                        "task_id": t["task_id"],
-                        "task_name": t["task_name"],
-                        "criticality": t["criticality"],
-                        "labor_hours": float(t["labor_hours"]),
-                        "interval_days": interval_days,
-                        "window_days": window_days,
-                        "due_date": due,
-                    }
-                )
-
-    df = pd.DataFrame(rows)
+    # Cross-join aircraft x applicable tasks in one merge; keep the original
+    # row indices so the seeded due-date offsets stay stable per pairing.
+    # Only carry the columns the forecast needs through the merge.
+    fleet_cols = fleet_df[["aircraft_id", "fleet_type", "base"]]
+    task_cols = task_df[
+        ["task_id", "task_name", "fleet_type", "criticality",
+         "labor_hours", "interval_days", "window_days"]
+    ]
+    merged = fleet_cols.reset_index(names="i").merge(
+        task_cols.reset_index(names="j"), on="fleet_type"
+    )
+    if merged.empty:
+        return pd.DataFrame()
+
+    interval_days = merged["interval_days"].to_numpy(dtype=np.int64)
+
+    if cfg.seed_history:
+        # spread due dates so each aircraft doesn't hit same day
+        offset = (
+            merged["i"].to_numpy(dtype=np.int64) * 7
+            + merged["j"].to_numpy(dtype=np.int64) * 3
+        ) % np.maximum(2, interval_days)
+        # last_done = start - max(1, interval - offset); due = last_done + interval
+        days_back = np.maximum(1, interval_days - offset)
+    else:
+        days_back = np.zeros_like(interval_days)
+
+    due = start + pd.to_timedelta(interval_days - days_back, unit="D")
+
+    df = pd.DataFrame(
+        {
+            "aircraft_id": merged["aircraft_id"],
+            "fleet_type": merged["fleet_type"],
+            "base": merged["base"],
+            "task_id": merged["task_id"],
+            "task_name": merged["task_name"],
+            "criticality": merged["criticality"],
+            "labor_hours": merged["labor_hours"].astype(float),
+            "interval_days": interval_days,
+            "window_days": merged["window_days"].astype(int),
+            "due_date": due,
+        }
+    )
+
+    # only keep items that enter the horizon or are near it (include slightly overdue)
+    df = df[df["due_date"] <= end]
     if df.empty:
         return df
 